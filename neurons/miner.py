@@ -18,6 +18,7 @@
 
 import time
 import typing
+import threading
 import bittensor as bt
 
 # Bittensor Miner:
@@ -38,19 +39,53 @@ class Miner(BaseMinerNeuron):
 
     def __init__(self, config=None):
         super(Miner, self).__init__(config=config)
-        self.benchmark_tensor = bt.Tensor.serialize(torch.zeros(*constants.BENCHMARK_SHAPE))
+        self._benchmark_payloads = {}
+        # Warm the serialized payload off the init path so the axon starts
+        # serving immediately; at worst an early benchmark request waits on it.
+        threading.Thread(target=self.get_benchmark_payload, daemon=True).start()
         self.job_id = 0
 
         self.axon.attach(
             forward_fn=self.forward_miner_status
         )
 
+    def get_benchmark_payload(self):
+        """
+        Returns the serialized benchmark tensor for the configured shape.
+
+        Serializing a multi-MB tensor is expensive, so the payload is built once
+        per shape and the same immutable object is reused for every response.
+        The cache is keyed by shape so a configuration update mid-run doesn't
+        serve a stale payload. The dtype must stay float32: validators score
+        raw duration with no size normalization, so a smaller payload would
+        measure as a proportionally faster miner.
+        """
+        shape = tuple(constants.BENCHMARK_SHAPE)
+        payload = self._benchmark_payloads.get(shape)
+        if payload is None:
+            payload = bt.Tensor.serialize(torch.zeros(*shape, dtype=torch.float32))
+            self._benchmark_payloads[shape] = payload
+        return payload
+
+    def resolve_uid(self, synapse: taomap.protocol.MapSynapse) -> typing.Optional[int]:
+        """
+        Resolves the caller's uid once per request. The axon runs blacklist,
+        priority and forward against the same synapse instance, so the first
+        lookup is cached on the synapse and the later stages reuse it — which
+        also keeps the uid consistent if the metagraph resyncs mid-request.
+        """
+        if '_cached_uid' in synapse.__dict__:
+            return synapse.__dict__['_cached_uid']
+        uid = self._hotkey_to_uid.get(synapse.dendrite.hotkey)
+        synapse.__dict__['_cached_uid'] = uid
+        return uid
+
     async def forward(
         self, synapse: taomap.protocol.Benchmark_Speed
     ) -> taomap.protocol.Benchmark_Speed:
-        uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
+        uid = self.resolve_uid(synapse)
         bt.logging.info(f"Benchmark request from validator-{uid} {synapse.dendrite.hotkey[:5]}")
-        synapse.tensor = self.benchmark_tensor
+        synapse.tensor = self.get_benchmark_payload()
         bt.logging.info("Returning tensor", synapse.shape)
         return synapse
 
@@ -58,11 +93,10 @@ class Miner(BaseMinerNeuron):
         self, synapse: taomap.protocol.Benchmark_Speed
     ) -> typing.Tuple[bool, str]:
         # TODO(developer): Define how miners should blacklist requests.
-        uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-        if (
-            not self.config.blacklist.allow_non_registered
-            and synapse.dendrite.hotkey not in self.metagraph.hotkeys
-        ):
+        uid = self.resolve_uid(synapse)
+        if uid is None:
+            if self.config.blacklist.allow_non_registered:
+                return False, "Allowing un-registered hotkey"
             # Ignore requests from un-registered entities.
             bt.logging.trace(
                 f"Blacklisting un-registered hotkey {synapse.dendrite.hotkey}"
@@ -80,9 +114,9 @@ class Miner(BaseMinerNeuron):
 
     async def priority(self, synapse: taomap.protocol.Benchmark_Speed) -> float:
         # TODO(developer): Define how miners should prioritize requests.
-        caller_uid = self.metagraph.hotkeys.index(
-            synapse.dendrite.hotkey
-        )  # Get the caller index.
+        caller_uid = self.resolve_uid(synapse)  # Get the caller index.
+        if caller_uid is None:
+            return 0.0
         prirority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
@@ -92,14 +126,10 @@ class Miner(BaseMinerNeuron):
         return prirority
 
     async def forward_miner_status(self, synapse: taomap.protocol.Status) -> taomap.protocol.Status:
-        try:
-            caller_uid = self.metagraph.hotkeys.index(synapse.dendrite.hotkey)
-            stake = self.metagraph.stake[caller_uid]
-            if stake >= constants.VALIDATOR_MIN_STAKE:
-                bt.logging.info(f"Miner status request from validator-{caller_uid} {synapse.dendrite.hotkey[:5]}")
-        except:
-            ...
-        
+        caller_uid = self.resolve_uid(synapse)
+        if caller_uid is not None and self.metagraph.stake[caller_uid] >= constants.VALIDATOR_MIN_STAKE:
+            bt.logging.info(f"Miner status request from validator-{caller_uid} {synapse.dendrite.hotkey[:5]}")
+
         synapse.version = constants.__version__
         synapse.job_id = self.job_id
         return synapse
@@ -32,15 +32,20 @@ from taomap.base.validator import BaseValidatorNeuron
 import wandb
 import taomap.constants as constants
 import random
-from sklearn.cluster import KMeans
 import numpy as np
 import os
 import json
+import shutil
+import tempfile
 import taomap.utils as utils
 import traceback
 import threading
+import queue
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 from taomap.validator.reward import get_rewards
+from taomap.utils.misc import deterministic_hash
 
 class Validator(BaseValidatorNeuron):
     """
@@ -54,11 +59,18 @@ class Validator(BaseValidatorNeuron):
     def __init__(self, config=None):
 
         self.term = 0
-        
+        self._block_cache = (0, 0.0)
+
         super(Validator, self).__init__(config=config)
 
         self.subtensor_benchmark = bt.subtensor(config=self.config)
-        
+
+        # Per-group benchmark uploads are drained by a background thread so the
+        # benchmark loop never blocks on wandb latency.
+        self._upload_queue = queue.Queue()
+        self._upload_thread = threading.Thread(target=self._upload_worker, daemon=True)
+        self._upload_thread.start()
+
         self.init_term_variables()
 
         bt.logging.info(self.config)
@@ -75,7 +87,8 @@ class Validator(BaseValidatorNeuron):
         self.voted_groups = []
         self.groups = None
         self.is_uploaded_group = False
-        self.benchmark_state = {}
+        # Fixed-size per-uid duration table; NaN marks uids not benchmarked yet.
+        self.benchmark_state = np.full(256, np.nan, dtype=np.float32)
         if hasattr(self, 'benchmark_thread') and self.benchmark_thread is not None:
             self.benchmark_thread.join(1)
         self.benchmark_thread = None
@@ -84,8 +97,23 @@ class Validator(BaseValidatorNeuron):
         self.update_term_bias()
         self.is_score_calculated = False
 
+    def current_block(self, subtensor=None):
+        """
+        Returns the chain block height, cached for a couple of seconds.
+
+        update_term_bias runs every forward and the benchmark thread polls every
+        second; without the cache each of those is a full RPC round-trip for a
+        value that only changes every ~12 seconds.
+        """
+        now = time.monotonic()
+        block, fetched_at = self._block_cache
+        if now - fetched_at > 2.0:
+            block = (subtensor or self.subtensor).get_current_block()
+            self._block_cache = (block, now)
+        return block
+
     def update_term_bias(self):
-        self.block_height = self.subtensor.get_current_block()
+        self.block_height = self.current_block()
         self.current_term = (self.block_height - constants.ORIGIN_TERM_BLOCK) // constants.BLOCKS_PER_TERM
         self.term_bias = (self.block_height - constants.ORIGIN_TERM_BLOCK) % constants.BLOCKS_PER_TERM
 
@@ -113,7 +141,7 @@ class Validator(BaseValidatorNeuron):
                     self.is_seedhash_commited = self.commit_data({
                         "type": "seedhash",
                         "term": self.term,
-                        "seedhash": hash(str(self.next_seed)),
+                        "seedhash": deterministic_hash(self.next_seed),
                         "benchmark_version": self.benchmark_version
                     })
                     bt.logging.info(f"Committed seed hash for term {self.term}")
@@ -128,14 +156,20 @@ class Validator(BaseValidatorNeuron):
                     self.is_uploaded_group = self.upload_state()
                 # Commit seed
                 if self.is_uploaded_group and not self.is_seed_commited:
-                    self.is_seed_commited = self.commit_data({
-                            "type": "seed",
-                            "term": self.term,
-                            "seedhash": hash(str(self.seed)),
-                            "seed": self.seed,
-                            "grouphash": hash(str(self.groups)),
-                            "version": self.is_uploaded_group
-                        })
+                    commit = {
+                        "type": "seed",
+                        "term": self.term,
+                        "seedhash": deterministic_hash(self.seed),
+                        "seed": self.seed,
+                        "grouphash": deterministic_hash(self.groups),
+                        "version": self.is_uploaded_group
+                    }
+                    # Embed the groups in the commitment itself when they fit, so
+                    # other validators can skip the wandb artifact round-trip. The
+                    # wandb upload stays as the fallback for oversize payloads.
+                    if len(json.dumps({**commit, "groups": self.groups})) <= constants.MAX_COMMIT_BYTES:
+                        commit["groups"] = self.groups
+                    self.is_seed_commited = self.commit_data(commit)
                     bt.logging.info(f"Committed seed for term {self.term}")
                 self.update_term_bias()
                                 
@@ -151,10 +185,28 @@ class Validator(BaseValidatorNeuron):
                 return
 
             return await forward(self)
-        except BaseException as e:
+        except Exception as e:
             bt.logging.error(f"Error forwarding: {e}")
             bt.logging.debug(traceback.format_exc())
 
+    def benchmark_state_dict(self):
+        """Exports the benchmark array as a uid-keyed dict, dropping uids that
+        were never benchmarked, so the uploaded artifact keeps its old format."""
+        return {int(uid): float(duration) for uid, duration in enumerate(self.benchmark_state) if not np.isnan(duration)}
+
+    def _upload_worker(self):
+        """Drains queued wandb uploads in the background; each item carries an
+        optional callback that receives the uploaded artifact version."""
+        while True:
+            artifact_name, filename, data, on_done = self._upload_queue.get()
+            version = self.upload_to_wandb(artifact_name, filename, data)
+            if on_done is not None:
+                on_done(version)
+            self._upload_queue.task_done()
+
+    def _set_benchmark_version(self, version):
+        self.benchmark_version = version
+
     def start_benchmark_thread(self):
         self.benchmark_thread = threading.Thread(target=self.benchmark, daemon=True)
         self.benchmark_thread.start()            
@@ -163,11 +215,20 @@ class Validator(BaseValidatorNeuron):
         bt.logging.info("Benchmarking thread started")
         benchmark_started = False
         current_term = self.current_term
-        current_block = self.subtensor_benchmark.get_current_block()
+        current_block = self.current_block(self.subtensor_benchmark)
         term_bias = (current_block - constants.ORIGIN_TERM_BLOCK) % constants.BLOCKS_PER_TERM
-        self.benchmark_state = self.download_from_wandb(f'benchmark-{self.uid}', f'benchmark-{self.current_term}')
-        if self.benchmark_state is None:
-            self.benchmark_state = {}
+        state = self.download_from_wandb(f'benchmark-{self.uid}', f'benchmark-{self.current_term}')
+        self.benchmark_state = np.full(256, np.nan, dtype=np.float32)
+        if state:
+            for uid, duration in state.items():
+                self.benchmark_state[int(uid)] = duration
+        # One loop for the thread's whole lifetime: dendrite caches its aiohttp
+        # session on the loop that first used it, so a per-group asyncio.run
+        # would close that loop and break every query after the first group.
+        # A dedicated dendrite keeps this thread off the session the status
+        # thread queries through.
+        loop = asyncio.new_event_loop()
+        benchmark_dendrite = bt.dendrite(wallet=self.wallet)
         while True:
             try:
                 if current_term != self.current_term:
@@ -187,20 +248,28 @@ class Validator(BaseValidatorNeuron):
                 if current_group_id >= len(self.voted_groups):
                     bt.logging.info("✅ Benchmarking finished")
                     self.benchmark_finished = True
-                    version = self.upload_to_wandb(f'final-benchmark-{self.uid}', f'benchmark-{self.current_term}', self.benchmark_state)
+                    version = self.upload_to_wandb(f'final-benchmark-{self.uid}', f'benchmark-{self.current_term}', self.benchmark_state_dict())
                     break
                 current_group = self.voted_groups[current_group_id] 
                 bt.logging.info(f"Benchmarking group {current_group_id}: {current_group}")
 
                 axons = [self.metagraph.axons[uid] for uid in current_group]
                 synapse = taomap.protocol.Benchmark_Speed(shape=list(constants.BENCHMARK_SHAPE))
-                benchmark_at = time.time()
-                responses = self.dendrite.query(axons, synapse, timeout = min(100, max(constants.BLOCKS_PER_GROUP * 8, 50)), deserialize = True)
+                timeout = min(100, max(constants.BLOCKS_PER_GROUP * 8, 50))
+                try:
+                    results = loop.run_until_complete(
+                        self.query_benchmark_group(benchmark_dendrite, axons, synapse, timeout)
+                    )
+                finally:
+                    # Drop the session between groups; the next group opens a
+                    # fresh one on this same loop.
+                    loop.run_until_complete(benchmark_dendrite.aclose_session())
                 for i, uid in enumerate(current_group):
-                    if responses[i] is None:
+                    benchmark_at, response = results[i]
+                    if response is None:
                         self.benchmark_state[uid] = -1
                         continue
-                    arrived_at, size = responses[i]
+                    arrived_at, size = response
                     bt.logging.info(f"Response from {uid}: {(size / 1024 / 1024):.2f} MB, time: {arrived_at - benchmark_at}")
                     self.benchmark_state[uid] = arrived_at - benchmark_at
                     if 'benchmark' not in self.miner_status[uid]:
@@ -210,31 +279,63 @@ class Validator(BaseValidatorNeuron):
                     else:
                         self.miner_status[uid]['benchmark'][self.current_term] = size / (arrived_at - benchmark_at)
                 
-                version = self.upload_to_wandb(f'benchmark-{self.uid}', f'benchmark-{self.current_term}', self.benchmark_state)
-                self.benchmark_version = version
-
-                # wait for the next group
+                self._upload_queue.put((
+                    f'benchmark-{self.uid}',
+                    f'benchmark-{self.current_term}',
+                    self.benchmark_state_dict(),
+                    self._set_benchmark_version,
+                ))
+
+                # wait for the next group; sleep through most of the window to the
+                # next group boundary instead of polling the chain every second,
+                # then fall back to short polls until the boundary block lands.
                 old_group_id = current_group_id
+                # The group query above can run for tens of seconds; refresh
+                # the block (cheap, 2s cache) before the boundary math or the
+                # first sleep overshoots by the query duration and can skip a
+                # whole group window.
+                current_block = self.current_block(self.subtensor_benchmark)
+                term_bias = (current_block - constants.ORIGIN_TERM_BLOCK) % constants.BLOCKS_PER_TERM
+                current_group_id = (term_bias - constants.BLOCKS_START_BENCHMARK) // constants.BLOCKS_PER_GROUP
+                next_boundary_block = current_block + constants.BLOCKS_PER_GROUP - (term_bias - constants.BLOCKS_START_BENCHMARK) % constants.BLOCKS_PER_GROUP
                 while old_group_id == current_group_id:
-                    time.sleep(1)
-                    current_block = self.subtensor_benchmark.get_current_block()
+                    remaining_blocks = next_boundary_block - current_block
+                    time.sleep(max(1.0, remaining_blocks * bt.__blocktime__ - 0.5))
+                    current_block = self.current_block(self.subtensor_benchmark)
                     term_bias = (current_block - constants.ORIGIN_TERM_BLOCK) % constants.BLOCKS_PER_TERM
                     current_group_id = (term_bias - constants.BLOCKS_START_BENCHMARK) // constants.BLOCKS_PER_GROUP
 
-            except BaseException as e:
+            except Exception as e:
                 bt.logging.error(f"Error benchmarking: {e}")
                 bt.logging.debug(traceback.format_exc())
                 time.sleep(0.1)
+        loop.close()
         bt.logging.info("Benchmarking thread finished")
-    
+
+    async def query_benchmark_group(self, dendrite, axons, synapse, timeout):
+        """
+        Queries all axons of a benchmark group concurrently, so a slow miner
+        doesn't serialize behind the others. Returns a list of
+        (benchmark_at, response) tuples in axon order, with a per-axon start
+        time so the measured duration stays accurate. `dendrite` is the
+        benchmark thread's own instance, never the shared one.
+        """
+        async def query_one(axon):
+            benchmark_at = time.time()
+            responses = await dendrite.forward([axon], synapse, timeout=timeout, deserialize=True)
+            return benchmark_at, responses[0]
+        return await asyncio.gather(*[query_one(axon) for axon in axons])
+
     def get_vote_result(self):
         # Download all commits and groups, seeds
-        validator_uids = [uid for uid in self.metagraph.uids if self.metagraph.stake[uid] >= constants.VALIDATOR_MIN_STAKE]
+        validator_uids = self._validator_uids
         bt.logging.info(f"Voting on validators {validator_uids}")
-        # Get all commits
+        # Get all commits; one bulk call when the endpoint supports it,
+        # otherwise per-uid fetches. Errors surface as None entries, so a bad
+        # validator can't poison the batch.
+        commit_datas = self.get_commit_data_many(validator_uids)
         commits = []
-        for uid in validator_uids:
-            commit_data = self.get_commit_data(uid)
+        for uid, commit_data in zip(validator_uids, commit_datas):
             bt.logging.info(f"Commit data {uid}: {commit_data}")
             if commit_data is None:
                 continue
@@ -249,28 +350,42 @@ class Validator(BaseValidatorNeuron):
                 "seed": commit_data["seed"],
                 "grouphash": commit_data["grouphash"],
                 "version": commit_data["version"],
+                "groups": commit_data.get("groups"),
             })
         bt.logging.info("Commits: ", commits)
 
-        # Get all shared seeds
+        # Commits that carry their groups inline need no artifact download.
         for commit in commits:
-            if commit['version'] is None:
-                continue
-            data = self.download_from_wandb(f"state-{commit['uid']}", f"{self.term }", commit['version'])
-            if not data:
-                commit['valid'] = False
-                bt.logging.warning(f"Error getting shared seed for {commit['uid']}")
-                continue
-            if commit["seedhash"] != data["hash"]:
-                commit['valid'] = False
-                bt.logging.warning(f"Seed hash mismatch for {commit['uid']}")
-                continue
-            commit['valid'] = True
-            commit['groups'] = data['groups']
+            if commit['groups'] is not None:
+                if commit["seedhash"] != deterministic_hash(commit["seed"]):
+                    commit['valid'] = False
+                    bt.logging.warning(f"Seed hash mismatch for {commit['uid']}")
+                else:
+                    commit['valid'] = True
+
+        # Download the remaining shared seeds concurrently.
+        pending = [commit for commit in commits if commit['groups'] is None and commit['version'] is not None]
+        if len(pending) > 0:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                datas = list(executor.map(
+                    lambda commit: self.download_from_wandb(f"state-{commit['uid']}", f"{self.term}", commit['version']),
+                    pending
+                ))
+            for commit, data in zip(pending, datas):
+                if not data:
+                    commit['valid'] = False
+                    bt.logging.warning(f"Error getting shared seed for {commit['uid']}")
+                    continue
+                if commit["seedhash"] != data["hash"]:
+                    commit['valid'] = False
+                    bt.logging.warning(f"Seed hash mismatch for {commit['uid']}")
+                    continue
+                commit['valid'] = True
+                commit['groups'] = data['groups']
 
         bt.logging.info("Commits with groups and seeds: ", commits)
 
-        valid_commits = [commit for commit in commits if commit['valid']]
+        valid_commits = [commit for commit in commits if commit.get('valid')]
 
         if len(valid_commits) == 0:
             bt.logging.warning("No valid commits")
@@ -285,30 +400,44 @@ class Validator(BaseValidatorNeuron):
         return voted_commit['uid'], voted_commit['groups']
         
     def upload_to_wandb(self, artifact_name, filename, data, ttl = None):
+        scratch_dir = None
         try:
             artifact = wandb.Artifact(artifact_name, type = 'dataset')
             if ttl:
                 artifact.ttl = timedelta(seconds=ttl)
-            file_path = self.config.neuron.full_path + f'/{filename}.json'
+            # Each upload writes into its own scratch directory: the upload
+            # worker and the benchmark thread's final synchronous upload both
+            # serialize to `{filename}.json`, so a shared path would let one
+            # rewrite and delete the file under the other's in-flight
+            # artifact.wait(). The basename must stay `{filename}.json` —
+            # downloaders look it up inside the artifact by that name.
+            scratch_dir = tempfile.mkdtemp(dir=self.config.neuron.full_path)
+            file_path = os.path.join(scratch_dir, f'{filename}.json')
             with open(file_path, 'w') as f:
-                json_str = json.dumps(data, indent=4)
+                # Compact separators: pretty-printing roughly triples the file
+                # size for a full benchmark dict and slows artifact.wait().
+                json_str = json.dumps(data, separators=(',', ':'))
                 f.write(json_str)
             artifact.add_file(file_path)
             self.wandb_run.log_artifact(artifact)
             artifact.wait()
             bt.logging.info(f'Uploaded {filename}.json to wandb, ver: {artifact.version}')
-            os.remove(file_path)
             return artifact.version
         except Exception as e:
             bt.logging.error(f'Error saving seed info: {e}')
             bt.logging.debug(traceback.format_exc())
             return None
+        finally:
+            if scratch_dir is not None:
+                shutil.rmtree(scratch_dir, ignore_errors=True)
 
     def download_from_wandb(self, artifact_name, filename, version = 'latest'):
         try:
             artifact_url = f"{self.config.wandb.entity}/{constants.WANDB_PROJECT}/{artifact_name}:{version}"
             artifact = wandb.use_artifact(artifact_url)
-            artifact_dir = artifact.download(self.config.neuron.full_path)
+            # Download into a per-artifact directory; different validators' artifacts
+            # share filenames, so concurrent downloads must not share a directory.
+            artifact_dir = artifact.download(os.path.join(self.config.neuron.full_path, artifact_name))
             shared_file = os.path.join(artifact_dir, f"{filename}.json")
             with open(shared_file, 'r') as f:
                 data = json.load(f)
@@ -327,9 +456,9 @@ class Validator(BaseValidatorNeuron):
         return self.upload_to_wandb(f'state-{self.uid}', f'{self.term}', {
                     "term": self.term,
                     "seed": self.seed,
-                    "hash": hash(str(self.seed)),
+                    "hash": deterministic_hash(self.seed),
                     "groups": self.groups,
-                    "grouphash": hash(str(self.groups))
+                    "grouphash": deterministic_hash(self.groups)
                 },
                 ttl = 3600 * 3)
 
@@ -349,108 +478,71 @@ class Validator(BaseValidatorNeuron):
             self (:obj:`bittensor.neuron.Neuron`): The neuron object which contains all the necessary state for the validator.
 
         """
-        def ip_to_int(ip):
-            octets = [int(x) for x in ip.split('.')]
-            return sum([octets[i] << (24 - 8 * i) for i in range(4)])
-        
         if self.miner_status is None:
             return []
-        
-        miner_uids = [uid for uid in self.metagraph.uids if self.metagraph.axons[uid].ip != "0.0.0.0" and self.miner_status[int(uid)]['job_id'] >= 0]
+
+        # Materialize stakes once; indexing the tensor per uid allocates a 0-d
+        # tensor on every access. The remaining per-uid checks are plain Python.
+        stakes = self.metagraph.S.cpu().numpy()
+        axons = self.metagraph.axons
+        miner_mask = stakes < constants.VALIDATOR_MIN_STAKE
+
+        # Select working miners and drop duplicate IPs in a single pass.
+        seen_ips = set()
+        miner_uids = []
+        ips = []
+        for uid in self.metagraph.uids.tolist():
+            if not miner_mask[uid]:
+                continue
+            ip = axons[uid].ip
+            if ip == "0.0.0.0" or ip in seen_ips:
+                continue
+            # miner_status is rebuilt by the status thread and may not cover
+            # every uid yet; a missing entry means the miner isn't reachable.
+            if (self.miner_status.get(uid) or {}).get('job_id', -1) < 0:
+                continue
+            seen_ips.add(ip)
+            miner_uids.append(uid)
+            ips.append(ip)
 
         if len(miner_uids) == 0:
             return []
 
-        ips = [self.metagraph.axons[uid].ip for uid in miner_uids]
-
         bt.logging.debug(f"Available miner uids: {miner_uids} {ips}")
-        # Filter out any duplicate IPs
-        unique_ips = set()
-        filtered_miner_uids = []
 
-        for uid in miner_uids:
-            ip = self.metagraph.axons[uid].ip
-            
-            if ip != "0.0.0.0" and ip not in unique_ips:
-                unique_ips.add(ip)
-                filtered_miner_uids.append(uid)
-
-        # Now, filtered_miner_uids contains uids with unique IPs and ips will have those unique IPs
-        ips = [self.metagraph.axons[uid].ip for uid in filtered_miner_uids]
-        miner_uids = filtered_miner_uids
-
-        numerical_ips = np.array([ip_to_int(ip) for ip in ips]).reshape(-1, 1)
+        # Convert dotted-quad IPs to integers in one vectorized pass instead of
+        # parsing octets one by one in Python.
+        octets = np.array([ip.split('.') for ip in ips], dtype=np.uint32)
+        octet_weights = np.array([1 << 24, 1 << 16, 1 << 8, 1], dtype=np.uint32)
+        numerical_ips = (octets * octet_weights).sum(axis=1).reshape(-1, 1)
         
-        group_count = len(miner_uids) // 4
-        groups = {}
-
-        if group_count > 0:
-            # Use K-Means to cluster IPs into 64 groups
-            kmeans = KMeans(n_clusters=group_count, random_state=random.randint(0, 100)).fit(numerical_ips)
-            labels = kmeans.labels_
-
-            # Group IPs based on labels
-            for i, label in enumerate(labels):
-                if label not in groups:
-                    groups[label] = []
-                groups[label].append(ips[i])
-
-        # Convert groups to a list of lists (each sub-list is a group of IPs)
-        groups_list = list(groups.values())
-
-        final_groups = []
-        leftovers = []
-
-        for group in groups_list:
-            if len(group) > 4:
-                # Split large groups into groups of 4
-                for i in range(0, len(group), 4):
-                    new_group = group[i:i+4]
-                    if len(new_group) == 4:
-                        final_groups.append(new_group)
-                    else:
-                        leftovers.extend(new_group)
-            elif len(group) < 4:
-                leftovers.extend(group)
-            else:
-                final_groups.append(group)
-
-        # Step 2: Merge leftovers to form new groups of 4, if possible
-        while len(leftovers) >= 4:
-            final_groups.append(leftovers[:4])
-            leftovers = leftovers[4:]
-        
-        final_groups.append(leftovers)
-
-        # Display the groups
-        for i, group in enumerate(final_groups):
-            print(f"Group {i+1}: {group}")
-        uid_groups = []
-        for group in final_groups:
-            uid_group = []
-            for ip in group:
-                uid_group.append(int(miner_uids[ips.index(ip)]))
-            uid_groups.append(uid_group)
+        # IPs are scalars, so clustering them by proximity reduces to a sort:
+        # adjacent IPs land in the same group, which is what 1-D K-Means
+        # approximated with ten Lloyd runs per call. Sorting and chunking runs
+        # of 4 also subsumes the old leftover-merging logic.
+        order = np.argsort(numerical_ips.ravel())
+        sorted_uids = [int(miner_uids[i]) for i in order]
+        uid_groups = [sorted_uids[i:i + 4] for i in range(0, len(sorted_uids), 4)]
+
+        bt.logging.debug(f"Miner groups: {uid_groups}")
         random.shuffle(uid_groups)
         return uid_groups
 
-    def should_set_weights(self) -> bool:
+    def should_set_weights(self, block=None) -> bool:
         """
         Returns True if the validator should set weights based on the current block height and the last time weights were set.
         """
-        if not super().should_set_weights():
+        if not super().should_set_weights(block):
             return False
-        if self.term_bias >= constants.BLOCKS_SEEDHASH_END:
-            return super().should_set_weights()
-        return False
+        return self.term_bias >= constants.BLOCKS_SEEDHASH_END
     
     def calculate_scores(self):
         bt.logging.info(f"Calculating scores for term-{self.term}")
         # Get other validator's commits.
         commits = []
-        validator_uids = [int(uid) for uid in self.metagraph.uids if self.metagraph.stake[uid] >= constants.VALIDATOR_MIN_STAKE]
-        for uid in validator_uids:
-            commit_data = self.get_commit_data(uid)
+        validator_uids = self._validator_uids
+        commit_datas = self.get_commit_data_many(validator_uids)
+        for uid, commit_data in zip(validator_uids, commit_datas):
             if commit_data is None:
                 continue
             commit_term_bias = self.get_term_bias(commit_data['block'])
@@ -460,29 +552,33 @@ class Validator(BaseValidatorNeuron):
             commits.append(commit_data)
         bt.logging.info(f"Commits: {commits}")
 
-        # Download from wandb
-        for commit in commits:
-            if 'benchmark_version' not in commit or commit['benchmark_version'] is None:
-                continue
-            data = self.download_from_wandb(f"benchmark-{commit['uid']}", f"benchmark-{self.term}", commit['benchmark_version'])
-            if data is None:
-                continue
-            commit['benchmark'] = data
+        # Download benchmark artifacts from wandb concurrently.
+        pending = [commit for commit in commits if commit.get('benchmark_version') is not None]
+        if len(pending) > 0:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                datas = list(executor.map(
+                    lambda commit: self.download_from_wandb(f"benchmark-{commit['uid']}", f"benchmark-{self.term}", commit['benchmark_version']),
+                    pending
+                ))
+            for commit, data in zip(pending, datas):
+                if data is None:
+                    continue
+                commit['benchmark'] = data
         
         # Filter out commits without benchmarks
         commits = [commit for commit in commits if 'benchmark' in commit]
         bt.logging.info(f"Commits with benchmarks: {commits}")
 
-        responses = []
-        miner_uids = []
-        for i in range(256):
-            response = []
-            for commit in commits:
-                if str(i) in commit['benchmark']:
-                    response.append(commit['benchmark'][str(i)])
-            if len(response) > 0:
-                responses.append(response)
-                miner_uids.append(i)
+        # Aggregate each commit's benchmark entries in one pass instead of probing
+        # all 256 uids against every commit. JSON round-trips dict keys as
+        # strings, so normalize them back to ints here.
+        aggregated = {}
+        for commit in commits:
+            for uid, duration in commit['benchmark'].items():
+                aggregated.setdefault(int(uid), []).append(duration)
+
+        miner_uids = sorted(aggregated)
+        responses = [aggregated[uid] for uid in miner_uids]
 
         if len(responses) == 0:
             return
@@ -21,6 +21,14 @@ __version__ = "2.0.1"
 version_split = __version__.split(".")
 __spec_version__ = (1000 * int(version_split[0])) + (10 * int(version_split[1])) + (1 * int(version_split[2]))
 
-# Import all submodules.
-from . import protocol
-from . import utils
+import importlib
+
+
+def __getattr__(name):
+    # Import submodules on first attribute access (PEP 562) instead of
+    # eagerly: protocol pulls in bittensor (and through it torch), which
+    # costs seconds that `import taomap` shouldn't pay when the caller only
+    # needs the version metadata above.
+    if name in ("protocol", "utils"):
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -136,7 +136,7 @@ class BaseMinerNeuron(BaseNeuron):
             exit()
 
         # In case of unforeseen errors, the miner will log the error and continue operations.
-        except BaseException as e:
+        except Exception as e:
             bt.logging.error(traceback.format_exc())
 
     def run_in_background_thread(self):
@@ -193,6 +193,9 @@ class BaseMinerNeuron(BaseNeuron):
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
 
+        # Rebuild the hotkey -> uid lookup to reflect the new metagraph.
+        self._rebuild_hotkey_map()
+
     def save_state(self):
         """Saves the state of the miner to the disk."""
         return
\ No newline at end of file
@@ -16,19 +16,25 @@
 # DEALINGS IN THE SOFTWARE.
 
 import copy
+import os
+import time
+import threading
 import typing
 
 import bittensor as bt
 import traceback
 
 from abc import ABC, abstractmethod
+from ast import literal_eval
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 # Sync calls set weights and also resyncs the metagraph.
 from taomap.utils.config import check_config, add_args, config
 from taomap.utils.misc import ttl_get_block
 from taomap import __spec_version__ as spec_version
-from taomap.mock import MockSubtensor, MockMetagraph
 import taomap.constants as constants
 import json
+import orjson
+from binascii import unhexlify
 import requests
 
 class BaseNeuron(ABC):
@@ -57,17 +63,70 @@ class BaseNeuron(ABC):
     metagraph: "bt.metagraph"
     spec_version: int = spec_version
 
+    # The remote configuration lands in module-level constants shared by every
+    # neuron in the process; the lock serializes writers and the network key
+    # lets a second neuron's startup skip the redundant apply.
+    _cfg_lock = threading.Lock()
+    _cfg_loaded_for: typing.Optional[str] = None
+
+    # (block, monotonic timestamp) of the last chain read; see `block` below.
+    _block_cache = (0, 0.0)
+
     @property
     def block(self):
-        return ttl_get_block(self)
+        # Busy loops read this property many times a second; a monotonic
+        # instance cache answers those reads locally and only falls through
+        # to ttl_get_block (and its RPC) every few seconds. Blocks arrive
+        # every ~12s, so a 6s window can never skip one.
+        now = time.monotonic()
+        block, fetched_at = self._block_cache
+        if now - fetched_at < 6.0:
+            return block
+        block = ttl_get_block(self)
+        self._block_cache = (block, now)
+        return block
 
     def __init__(self, config=None):
-        base_config = copy.deepcopy(config or BaseNeuron.config())
+        # A freshly parsed config needs no copy at all; a caller-provided one
+        # gets a shallow copy so merge() can't mutate the caller's object.
+        # deepcopy walked every leaf through the pickle machinery and was a
+        # measurable chunk of neuron cold start.
+        base_config = BaseNeuron.config() if config is None else copy.copy(config)
         self.config = self.config()
         self.config.merge(base_config)
         self.check_config(self.config)
 
-        self.load_configuration()
+        # All API traffic goes through one pooled session so repeated calls
+        # reuse the TCP+TLS connection instead of handshaking every time.
+        # The adapter imports are deferred to here so importing this module
+        # for config()/add_args introspection doesn't pay for them.
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                # The API's POSTs (commits) are idempotent per uid, so they
+                # are as safe to retry as the GETs.
+                allowed_methods=frozenset(["GET", "POST"]),
+            ),
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
+        # Kick the remote configuration fetch off in the background; the HTTP
+        # round trip overlaps the wallet/subtensor/metagraph construction below
+        # and is resolved before anything reads the configured constants.
+        # shutdown(wait=False) lets the worker thread exit after the one task
+        # instead of idling for the life of the process.
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-fetch")
+        self._config_future = executor.submit(self._fetch_configuration)
+        executor.shutdown(wait=False)
 
         # Set up logging with the provided configuration and directory.
         bt.logging(config=self.config, logging_dir=self.config.full_path)
@@ -84,6 +143,10 @@ class BaseNeuron(ABC):
 
         # The wallet holds the cryptographic key pairs for the miner.
         if self.config.mock:
+            # mock.py subclasses bittensor's mock classes at import time;
+            # only load it on the mock path.
+            from taomap.mock import MockSubtensor, MockMetagraph
+
             self.wallet = bt.MockWallet(config=self.config)
             self.subtensor = MockSubtensor(
                 self.config.netuid, wallet=self.wallet
@@ -95,7 +158,29 @@ class BaseNeuron(ABC):
             self.wallet = bt.wallet(config=self.config)
             self.subtensor = bt.subtensor(config=self.config)
             self.metagraph = self.subtensor.metagraph(self.config.netuid)
-        
+
+        # Resolving wallet.hotkey can touch the keystore; read the address
+        # once and reuse it everywhere.
+        self._my_ss58 = self.wallet.hotkey.ss58_address
+        self._rebuild_hotkey_map()
+
+        # Apply the remote configuration before anything reads the constants.
+        # A later neuron constructed in the same process finds the constants
+        # already populated for its network and skips the apply.
+        try:
+            remote_config = self._config_future.result(timeout=10)
+            self._apply_remote_configuration(remote_config)
+        except FuturesTimeoutError:
+            # The session's retry budget (3 attempts with backoff) can
+            # legitimately outlast this wait on a slow first run. Nothing on
+            # the miner path ever re-applies configuration, so apply the
+            # result whenever the fetch lands rather than discarding it.
+            bt.logging.warning("Configuration fetch still in flight; applying when it completes")
+            self._config_future.add_done_callback(self._on_config_fetched)
+        except Exception as e:
+            bt.logging.warning(f"Error loading configuration: {e}")
+            bt.logging.debug(traceback.format_exc())
+
         self.last_synced_block = self.block
 
         bt.logging.info(f"Wallet: {self.wallet}")
@@ -106,14 +191,19 @@ class BaseNeuron(ABC):
         self.check_registered()
 
         # Each miner gets a unique identity (UID) in the network for differentiation.
-        self.uid = self.metagraph.hotkeys.index(
-            self.wallet.hotkey.ss58_address
-        )
+        self.uid = self._hotkey_to_uid[self._my_ss58]
         bt.logging.info(
             f"Running neuron on subnet: {self.config.netuid} with uid {self.uid} using network: {self.subtensor.chain_endpoint}"
         )
         self.step = 0
 
+        # Neither operand changes after init; fold them out of the
+        # per-tick should_set_weights check.
+        self._weights_enabled = (
+            not self.config.neuron.disable_set_weights
+            and self.neuron_type != "MinerNeuron"
+        )
+
     @abstractmethod
     async def forward(self, synapse: bt.Synapse) -> bt.Synapse:
         ...
@@ -128,23 +218,35 @@ class BaseNeuron(ABC):
         """
         # Ensure miner or validator hotkey is still registered on the network.
 
-        if self.should_sync_metagraph():
+        # Read the block once per sync tick; the predicates below would each
+        # re-resolve it through the cached RPC otherwise.
+        block = self.block
+
+        if self.should_sync_metagraph(block):
             self.check_registered()
             self.resync_metagraph()
-            self.last_synced_block = self.block
+            self.last_synced_block = block
 
-        if self.should_set_weights():
+        if self.should_set_weights(block):
             self.set_weights()
 
         # Always save state.
         if self.step > 0:
             self.save_state()
 
+    def _rebuild_hotkey_map(self):
+        """
+        Rebuilds the O(1) hotkey -> uid lookup. Called on construction and
+        after every metagraph resync so request paths never fall back to an
+        O(N) `hotkeys.index` scan.
+        """
+        self._hotkey_to_uid = {hotkey: uid for uid, hotkey in enumerate(self.metagraph.hotkeys)}
+
     def check_registered(self):
         # --- Check for registration.
         if not self.subtensor.is_hotkey_registered(
             netuid=self.config.netuid,
-            hotkey_ss58=self.wallet.hotkey.ss58_address,
+            hotkey_ss58=self._my_ss58,
         ):
             bt.logging.error(
                 f"Wallet: {self.wallet} is not registered on netuid {self.config.netuid}."
@@ -152,27 +254,25 @@ class BaseNeuron(ABC):
             )
             exit()
 
-    def should_sync_metagraph(self):
+    def should_sync_metagraph(self, block=None):
         """
         Check if enough epoch blocks have elapsed since the last checkpoint to sync.
         """
-        return self.block - self.last_synced_block > self.config.neuron.sync_length
-
-    def should_set_weights(self) -> bool:
-        # Don't set weights on initialization.
-        if self.step == 0:
+        block = block if block is not None else self.block
+        return block - self.last_synced_block > self.config.neuron.sync_length
+
+    def should_set_weights(self, block=None) -> bool:
+        # _weights_enabled folds the disable flag and the miner check
+        # (miners never set weights) into one precomputed boolean; the
+        # step > 0 guard skips the initialization tick.
+        if not self._weights_enabled or self.step == 0:
             return False
 
+        block = block if block is not None else self.block
         # Check if enough epoch blocks have elapsed since the last epoch.
-        if self.config.neuron.disable_set_weights:
-            return False
-
-        # Define appropriate logic for when set weights.
         return (
-            (self.block - self.metagraph.last_update[self.uid])
-            > self.config.neuron.epoch_length
-            and self.neuron_type != "MinerNeuron"
-        )  # don't set weights if you're a miner
+            block - self.metagraph.last_update[self.uid]
+        ) > self.config.neuron.epoch_length
 
     def save_state(self):
         bt.logging.warning(
@@ -185,34 +285,146 @@ class BaseNeuron(ABC):
         )
 
     def load_configuration(self):
+        """
+        Fetches and applies the remote configuration. Unlike the startup path,
+        an explicit call always re-applies — the validator uses it to pick up
+        configuration changes at each term boundary, so it bypasses the
+        freshness fast path and goes to the network.
+        """
         try:
-            url = f"{constants.API_URL}/config/mainnet.json"
-            if self.config.subtensor.network == 'test':
-                url = f"{constants.API_URL}/config/testnet.json"
-            response = requests.get(url)
-            if response.status_code != 200:
-                bt.logging.error(f"Error getting configuration: {response.text}")
-                return
-            config = response.json()
-            constants.WANDB_PROJECT = config['WANDB_PROJECT']
-            constants.ORIGIN_TERM_BLOCK = config['ORIGIN_TERM_BLOCK']
-            constants.BLOCKS_PER_TERM = config['BLOCKS_PER_TERM']
-            constants.BLOCKS_SHARE_SEED = config['BLOCKS_SHARE_SEED']
-            constants.BLOCKS_START_BENCHMARK = config['BLOCKS_START_BENCHMARK']
-            constants.BLOCKS_PER_GROUP = config['BLOCKS_PER_GROUP']
-            constants.BLOCKS_SEEDHASH_START = config['BLOCKS_SEEDHASH_START']
-            constants.BLOCKS_SEEDHASH_END = config['BLOCKS_SEEDHASH_END']
-            constants.BENCHMARK_SHAPE = eval(config['BENCHMARK_SHAPE'])
-            constants.VALIDATOR_MIN_STAKE = config['VALIDATOR_MIN_STAKE']
-            
-            bt.logging.success(f"Loaded configuration: {config}")
-        except BaseException as e:
+            config = self._fetch_configuration(max_age=0)
+            if config is not None:
+                with BaseNeuron._cfg_lock:
+                    self._apply_configuration(config)
+                    BaseNeuron._cfg_loaded_for = self.config.subtensor.network
+        except Exception as e:
             bt.logging.error(f"Error loading configuration: {e}")
             bt.logging.debug(traceback.format_exc())
 
+    def _apply_remote_configuration(self, config):
+        """
+        Applies a startup config fetch under the process-wide guard: a neuron
+        constructed after another already applied for this network skips it.
+        """
+        key = self.config.subtensor.network
+        with BaseNeuron._cfg_lock:
+            if BaseNeuron._cfg_loaded_for != key and config is not None:
+                self._apply_configuration(config)
+                BaseNeuron._cfg_loaded_for = key
+
+    def _on_config_fetched(self, future):
+        """Applies a configuration fetch that outlived the startup wait."""
+        try:
+            self._apply_remote_configuration(future.result())
+        except Exception as e:
+            bt.logging.warning(f"Error loading configuration: {e}")
+            bt.logging.debug(traceback.format_exc())
+
+    def _fetch_configuration(self, max_age=3600):
+        """
+        Fetches the remote configuration dict for the current network.
+
+        A cached copy younger than `max_age` seconds is returned without any
+        network traffic (restarts are frequent and the config rarely changes),
+        with a background thread refreshing the cache for the next reader.
+        Pass `max_age=0` to force the network fetch.
+
+        Returns None when neither the network nor the on-disk cache can provide
+        it. Safe to call from a worker thread; it only touches `self.config`.
+        """
+        network = 'testnet' if self.config.subtensor.network == 'test' else 'mainnet'
+        url = f"{constants.API_URL}/config/{network}.json"
+        cache_path = constants.ROOT_DIR / ".cache" / f"config_{network}.json"
+        etag_path = cache_path.with_suffix(".etag")
+
+        if max_age > 0 and cache_path.exists() and time.time() - cache_path.stat().st_mtime < max_age:
+            try:
+                config = json.loads(cache_path.read_text())
+                threading.Thread(target=self._refresh_configuration, daemon=True).start()
+                return config
+            except ValueError:
+                pass  # corrupt cache file: fall through to the network.
+
+        # Conditional GET: with the cached ETag the server answers 304 with
+        # an empty body when the config hasn't changed, and the cached copy
+        # keeps startup working through a network outage.
+        # Ask for gzip explicitly; requests inflates transparently and the
+        # config body shrinks several-fold on the wire as it grows.
+        headers = {"Accept-Encoding": "gzip"}
+        if cache_path.exists() and etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text()
+
+        config = None
+        try:
+            response = self._http.get(url, headers=headers, timeout=(3, 10))
+            if response.status_code == 200:
+                config = response.json()
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_suffix(".tmp")
+                tmp_path.write_text(response.text)
+                os.replace(tmp_path, cache_path)
+                if response.headers.get("ETag"):
+                    etag_path.write_text(response.headers["ETag"])
+            elif response.status_code == 304:
+                # The server confirmed the cached copy is current; bump its
+                # mtime so the freshness fast path keeps trusting it.
+                os.utime(cache_path, None)
+            else:
+                bt.logging.error(f"Error getting configuration: {response.text}")
+        except Exception as e:
+            bt.logging.warning(f"Error fetching configuration: {e}")
+
+        if config is None:
+            # 304, HTTP error or network failure: use the cached copy.
+            if not cache_path.exists():
+                return None
+            config = json.loads(cache_path.read_text())
+        return config
+
+    def _refresh_configuration(self):
+        """
+        Re-fetches the configuration over the network and re-applies it if it
+        changed. Runs in a daemon thread after a cache-served startup so the
+        fast path never hands out a copy that is both served and stale.
+        """
+        try:
+            config = self._fetch_configuration(max_age=0)
+            if config is not None:
+                with BaseNeuron._cfg_lock:
+                    self._apply_configuration(config)
+                    # Mark the network as applied so a startup apply that is
+                    # still waiting on wallet/metagraph construction can't
+                    # overwrite this fresh config with the cached copy.
+                    BaseNeuron._cfg_loaded_for = self.config.subtensor.network
+        except Exception as e:
+            bt.logging.debug(f"Background configuration refresh failed: {e}")
+
+    # Coercions for fields the API doesn't serve in their final type. The
+    # shape historically arrived as a stringified tuple; parse it with
+    # literal_eval (no code execution) and accept a JSON array too.
+    _CONFIG_COERCIONS = {
+        'BENCHMARK_SHAPE': lambda v: literal_eval(v) if isinstance(v, str) else tuple(v),
+    }
+
+    def _apply_configuration(self, config):
+        """
+        Swaps the fetched configuration into `constants.RUNTIME` in a single
+        assignment, so concurrent readers never observe a half-applied update.
+
+        The RuntimeConfig fields are the single list of configurable keys: a
+        new server field only needs a dataclass field (plus a coercion here
+        if it isn't served in its final type).
+        """
+        constants.RUNTIME = constants.RuntimeConfig(**{
+            key: self._CONFIG_COERCIONS.get(key, lambda v: v)(config[key])
+            for key in constants.RuntimeConfig.__dataclass_fields__
+        })
+
+        bt.logging.success(f"Loaded configuration: {config}")
+
     
     def commit_data_mock(self, data: dict[str, any]):
-        response = requests.post(f"{constants.API_URL}/testnet/commit/{self.uid}", json=data)
+        response = self._http.post(f"{constants.API_URL}/testnet/commit/{self.uid}", json=data, timeout=(3, 10))
         if response.status_code != 200:
             bt.logging.error(f"Error committing: {response.text}")
             bt.logging.debug(response.status_code)
@@ -222,42 +434,94 @@ class BaseNeuron(ABC):
     def commit_data(self, data: dict[str, any]):
         # if self.config.subtensor.network == 'test':
         #     return self.commit_data_mock(data)
-        commit_str = json.dumps(data)
+        # subtensor.commit expects a str; orjson emits bytes directly.
+        commit_str = orjson.dumps(data).decode()
         try:
             self.subtensor.commit(self.wallet, self.config.netuid, commit_str)
             bt.logging.info(f"Committed: {commit_str}")
             return True
-        except BaseException as e:
+        except Exception as e:
             bt.logging.error(f"Error committing: {e}")
             bt.logging.debug(traceback.format_exc())
             return False
         
     def get_commit_data_mock(self, uid):
-        response = requests.get(f"{constants.API_URL}/testnet/commit/{uid}")
+        response = self._http.get(f"{constants.API_URL}/testnet/commit/{uid}", timeout=(3, 10))
         if response.status_code != 200:
             bt.logging.error(f"Error getting commitment: {response.text}")
             return None
         return response.json()
     
     def get_commit_data_from_api(self, uid):
-        response = requests.get(f"{constants.API_URL}/mainnet/commit/{uid}")
+        response = self._http.get(f"{constants.API_URL}/mainnet/commit/{uid}", timeout=(3, 10))
         if response.status_code != 200:
             bt.logging.error(f"Error getting commitment: {response.text}")
             return None
-        return response.json()
+        return orjson.loads(response.content)
+
+    def get_commit_data_bulk(self, uids):
+        """
+        Fetches commit data for many uids with a single POST to the bulk
+        endpoint, collapsing N round trips into one. Returns a uid-keyed dict,
+        or None when the endpoint is unavailable so callers can fall back to
+        per-uid requests.
+        """
+        try:
+            response = self._http.post(
+                f"{constants.API_URL}/mainnet/commits",
+                json={"uids": [int(uid) for uid in uids]},
+                timeout=(3, 15),
+            )
+            if response.status_code != 200:
+                bt.logging.debug(f"Bulk commit endpoint unavailable: {response.status_code}")
+                return None
+            return {int(k): v for k, v in orjson.loads(response.content).items()}
+        except Exception as e:
+            bt.logging.debug(f"Bulk commit endpoint unavailable: {e}")
+            return None
+
+    def get_commit_data_many(self, uids):
+        """
+        Returns commit data for `uids` as a list aligned with the input,
+        preferring the bulk endpoint over per-uid requests. Responses are
+        reused across calls within the same block so back-to-back callers
+        don't re-hit the API for identical data.
+        """
+        cache_key = (self.block, tuple(int(uid) for uid in uids))
+        cached = getattr(self, '_commit_cache', None)
+        if cached is not None and cached[0] == cache_key:
+            data = cached[1]
+        else:
+            data = self.get_commit_data_bulk(uids)
+            if data is None:
+                # The per-uid calls are I/O-bound, so fan them out rather than
+                # paying one round trip after another; the pooled session keeps
+                # this from piling up TLS handshakes.
+                with ThreadPoolExecutor(max_workers=min(32, max(1, len(uids)))) as executor:
+                    results = list(executor.map(self.get_commit_data, uids))
+                data = {int(uid): result for uid, result in zip(uids, results)}
+            self._commit_cache = (cache_key, data)
+        return [data.get(int(uid)) for uid in uids]
 
     def get_commit_data(self, uid):
         return self.get_commit_data_from_api(uid)
+
+    def get_commit_data_onchain(self, uid):
+        """
+        Reads a commitment straight from chain metadata instead of the API.
+        Kept as an explicit alternative for callers that can't trust the API;
+        it pays a subtensor round trip per uid.
+        """
         try:
-            metadata = bt.extrinsics.serving.get_metadata(self.subtensor, self.config.netuid, self.hotkeys[uid] )
+            metadata = bt.extrinsics.serving.get_metadata(self.subtensor, self.config.netuid, self.metagraph.hotkeys[uid])
             if metadata is None:
                 return None
             last_commitment = metadata["info"]["fields"][0]
             hex_data = last_commitment[list(last_commitment.keys())[0]][2:]
-            data = json.loads(bytes.fromhex(hex_data).decode())
+            data = orjson.loads(unhexlify(hex_data))
             data['block'] = metadata['block']
             return data
-        except BaseException as e:
+        except Exception as e:
             bt.logging.error(f"Error getting commitment: {e}")
             bt.logging.debug(traceback.format_exc())
             return None
@@ -19,6 +19,7 @@
 
 import copy
 import torch
+import numpy as np
 import asyncio
 import argparse
 import threading
@@ -74,6 +75,9 @@ class BaseValidatorNeuron(BaseNeuron):
             self.metagraph.n, dtype=torch.float32, device=self.device
         )
 
+        # Cache stake-derived uid sets so forward passes don't rescan the metagraph.
+        self.refresh_stake_cache()
+
         bt.logging.info("load_state()")
         self.load_state()
 
@@ -125,11 +129,11 @@ class BaseValidatorNeuron(BaseNeuron):
                 bt.logging.info(
                     f"Running validator {self.axon} on network: {self.config.subtensor.chain_endpoint} with netuid: {self.config.netuid}"
                 )
-            except BaseException as e:
+            except Exception as e:
                 bt.logging.error(f"Failed to serve Axon with exception: {e}")
                 pass
 
-        except BaseException as e:
+        except Exception as e:
             bt.logging.error(
                 f"Failed to create Axon initialize with exception: {e}"
             )
@@ -142,7 +146,7 @@ class BaseValidatorNeuron(BaseNeuron):
         ]
         try:
             await asyncio.gather(*coroutines)
-        except BaseException as e:
+        except Exception as e:
             bt.logging.error(f"Error in concurrent_forward: {e}")
             bt.logging.debug(traceback.format_exc())
 
@@ -189,7 +193,7 @@ class BaseValidatorNeuron(BaseNeuron):
                     self.sync()
 
                 # In case of unforeseen errors, the validator will log the error and continue operations.
-                except BaseException as err:
+                except Exception as err:
                     bt.logging.error("Error during validation", str(err))
                     bt.logging.debug(
                         print_exception(type(err), err, err.__traceback__)
@@ -323,6 +327,7 @@ class BaseValidatorNeuron(BaseNeuron):
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
+        self._rebuild_hotkey_map()
 
         # Check if the metagraph axon info has changed.
         if previous_metagraph.axons == self.metagraph.axons:
@@ -350,6 +355,20 @@ class BaseValidatorNeuron(BaseNeuron):
         # Update the hotkeys.
         self.hotkeys = copy.deepcopy(self.metagraph.hotkeys)
 
+        self.refresh_stake_cache()
+
+    def refresh_stake_cache(self):
+        """
+        Precomputes the validator uid list from the metagraph stake tensor.
+
+        Indexing `metagraph.stake[uid]` per uid crosses the torch boundary once per
+        element; a single vectorized comparison replaces those scans, and callers
+        read the cached lists instead of rebuilding them every forward.
+        """
+        self._stake_np = self.metagraph.S.cpu().numpy()
+        validator_mask = self._stake_np >= constants.VALIDATOR_MIN_STAKE
+        self._validator_uids = np.nonzero(validator_mask)[0].tolist()
+
     def update_scores(self, rewards: torch.FloatTensor, uids: List[int]):
         """Performs exponential moving average on the scores based on the rewards received from the miners."""
 
@@ -412,7 +431,7 @@ class BaseValidatorNeuron(BaseNeuron):
             self.hotkeys = state["hotkeys"]
             self.is_seed_shared = state["seed_shared"]
             bt.logging.info(f"Loaded state: {state}")
-        except BaseException as e:
+        except Exception as e:
             bt.logging.error(f"Failed to load state with exception: {e}")
             bt.logging.debug(traceback.format_exc())
     
@@ -450,7 +469,7 @@ class BaseValidatorNeuron(BaseNeuron):
                     continue
                 if self.should_exit:
                     break
-            except BaseException as e:
+            except Exception as e:
                 bt.logging.error(f"Error in run_status: {e}")
                 bt.logging.debug(traceback.format_exc())
             time.sleep(bt.__blocktime__ * 16)
@@ -1,21 +1,51 @@
+from dataclasses import dataclass
 from pathlib import Path
 
 __version__ = "2.0.1"
 
-WANDB_PROJECT = "taomap"
-
 API_URL = "https://api.taomap.ai"
 # The root directory of this project.
 ROOT_DIR = Path(__file__).parent.parent
 
-ORIGIN_TERM_BLOCK = 2586000
-BLOCKS_PER_TERM = 360
-BLOCKS_SHARE_SEED = 20
-BLOCKS_START_BENCHMARK = 40
-BLOCKS_PER_GROUP = 4
-BLOCKS_SEEDHASH_START = 220
-BLOCKS_SEEDHASH_END = 240
+# Maximum size of an on-chain commitment payload in bytes.
+MAX_COMMIT_BYTES = 1024
+
+
+@dataclass(frozen=True)
+class RuntimeConfig:
+    """
+    The remotely configurable constants, bundled into one immutable object.
+
+    Updates replace the whole `RUNTIME` binding in a single assignment, so a
+    reader always sees either the previous or the next configuration — never a
+    half-applied mix of the two.
+    """
+
+    WANDB_PROJECT: str = "taomap"
+    ORIGIN_TERM_BLOCK: int = 2586000
+    BLOCKS_PER_TERM: int = 360
+    BLOCKS_SHARE_SEED: int = 20
+    BLOCKS_START_BENCHMARK: int = 40
+    BLOCKS_PER_GROUP: int = 4
+    BLOCKS_SEEDHASH_START: int = 220
+    BLOCKS_SEEDHASH_END: int = 240
+    BENCHMARK_SHAPE: tuple = (20, 1024, 1024)
+    VALIDATOR_MIN_STAKE: int = 5000
+
+
+# Per-release overrides on top of the RuntimeConfig defaults. A release that
+# changes a constant adds only the diff here instead of forking a whole copy
+# of this module, so values can't silently drift between versions.
+CONFIG_PRESETS = {
+    "2.0.1": {},
+}
+
+RUNTIME = RuntimeConfig(**CONFIG_PRESETS.get(__version__, {}))
 
-BENCHMARK_SHAPE = (20, 1024, 1024)
 
-VALIDATOR_MIN_STAKE = 5000
+def __getattr__(name):
+    # Keep `constants.BLOCKS_PER_TERM`-style reads working by delegating the
+    # runtime keys to the current RUNTIME object (PEP 562).
+    if name in RuntimeConfig.__dataclass_fields__:
+        return getattr(RUNTIME, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -18,12 +18,35 @@
 
 import time
 import math
+import json
 import hashlib as rpccheckhealth
+from hashlib import blake2b
 from math import floor
 from typing import Callable, Any
 from functools import lru_cache, update_wrapper, partial
 import multiprocessing
 
+def deterministic_hash(value) -> str:
+    """
+    Computes a short hash of `value` that is stable across processes.
+
+    The built-in `hash()` is randomized per process (PYTHONHASHSEED), so two
+    validators hashing the same seed would disagree and the commit-reveal
+    comparison would always fail. Lists and dicts are serialized with sorted
+    keys first so the digest doesn't depend on insertion order.
+
+    Args:
+        value: The value to hash. Containers are JSON-serialized; anything else
+               is hashed via its `str()` representation.
+
+    Returns:
+        str: A 16-character hex digest.
+    """
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, sort_keys=True)
+    return blake2b(str(value).encode(), digest_size=8).hexdigest()
+
+
 # LRU Cache with TTL
 def ttl_cache(maxsize: int = 128, typed: bool = False, ttl: int = -1):
     """